@@ -22,6 +22,7 @@ from datetime import datetime, timedelta
 from cert.gd_base_test_facade_only import GdFacadeOnlyBaseTestClass
 from cert.event_callback_stream import EventCallbackStream
 from cert.event_asserts import EventAsserts
+from cert import gap_data
 
 # Test packet nesting
 from bluetooth_packets_python3 import hci_packets
@@ -196,6 +197,20 @@ class CertSelfTest(GdFacadeOnlyBaseTestClass):
             return True  # Failed as expected
         return False
 
+    def test_assert_occurs_on_independent_streams_overlaps(self):
+        with EventCallbackStream(FetchEvents(events=[1], delay_ms=500)) as first_stream, \
+            EventCallbackStream(FetchEvents(events=[2], delay_ms=500)) as second_stream:
+            first_asserts = EventAsserts(first_stream)
+            second_asserts = EventAsserts(second_stream)
+            start_time = datetime.now()
+            first_asserts.assert_event_occurs(
+                lambda data: data.value_ == 1, timeout=timedelta(seconds=1))
+            second_asserts.assert_event_occurs(
+                lambda data: data.value_ == 2, timeout=timedelta(seconds=1))
+            asserts.assert_true(
+                datetime.now() - start_time < timedelta(milliseconds=900),
+                "Waits on independent streams did not overlap")
+
     def test_skip_a_test(self):
         asserts.skip("Skipping this test because it's blocked by b/xyz")
         assert False
@@ -230,3 +245,11 @@ class CertSelfTest(GdFacadeOnlyBaseTestClass):
             hci_packets.BroadcastFlag.POINT_TO_POINT, request)
         asserts.assert_true(
             len(wrapped.Serialize()) == 16, "Packet serialized incorrectly")
+
+    def test_gap_data_complete_local_name(self):
+        gap_name = hci_packets.GapData()
+        gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
+        gap_name.data = list(b'Im_The_DUT')
+        asserts.assert_equal(
+            gap_data.complete_local_name(b'Im_The_DUT'),
+            bytes(gap_name.Serialize()))
@@ -36,6 +36,11 @@ class EventAsserts(object):
     When asserting on simultaneous events, you would need multiple EventAsserts
     objects as each EventAsserts object owns a separate queue that is actively
     being popped as asserted events happen
+
+    Since every queue is filled in the background by its EventCallbackStream,
+    asserting on independent streams one after another already overlaps the
+    waits: the total time is bounded by the slowest event rather than by the
+    sum of all timeouts
     """
     DEFAULT_TIMEOUT_SECONDS = 3
 
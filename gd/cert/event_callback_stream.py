@@ -50,7 +50,8 @@ class EventCallbackStream(object):
             raise ValueError("server_stream_call must not be None")
         self.server_stream_call = server_stream_call
         self.handlers = []
-        self.executor = ThreadPoolExecutor()
+        # Only the event loop below ever runs on this executor
+        self.executor = ThreadPoolExecutor(max_workers=1)
         self.future = self.executor.submit(EventCallbackStream._event_loop,
                                            self)
 
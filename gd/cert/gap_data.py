@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+#
+#   Copyright 2019 - The Android Open Source Project
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+COMPLETE_LOCAL_NAME = 0x09
+
+
+def complete_local_name(name):
+    """
+    Serialize |name| as a COMPLETE_LOCAL_NAME GAP data entry, producing the
+    same bytes as hci_packets.GapData.Serialize() without going through the
+    packet bindings: a length byte covering the type byte and the data, the
+    type byte, then the data
+    """
+    return bytes([len(name) + 1, COMPLETE_LOCAL_NAME]) + name
@@ -24,6 +24,13 @@ import signal
 import subprocess
 
 ANDROID_BUILD_TOP = os.environ.get('ANDROID_BUILD_TOP')
+# Shift every configured port by this amount so that several act.py
+# invocations can run side by side, each with its own rootcanal and stacks
+GD_CERT_PORT_OFFSET = int(os.environ.get('GD_CERT_PORT_OFFSET', '0'))
+
+
+def offset_port(port):
+    return str(int(port) + GD_CERT_PORT_OFFSET)
 
 
 class GdFacadeOnlyBaseTestClass(BaseTestClass):
@@ -32,6 +39,15 @@ class GdFacadeOnlyBaseTestClass(BaseTestClass):
 
         log_path_base = context.get_current_context().get_full_output_path()
         gd_devices = self.controller_configs.get("GdDevice")
+        for gd_device in gd_devices:
+            # Configs may be shared between test classes, keep the original
+            # ports around so that the offset is only applied once
+            for port_key in [
+                    "grpc_port", "grpc_root_server_port", "signal_port"
+            ]:
+                base_port = gd_device.setdefault("base_" + port_key,
+                                                 gd_device[port_key])
+                gd_device[port_key] = offset_port(base_port)
 
         self.rootcanal_running = False
         if 'rootcanal' in self.controller_configs:
@@ -40,15 +56,17 @@ class GdFacadeOnlyBaseTestClass(BaseTestClass):
                                              'rootcanal_logs.txt')
             self.rootcanal_logs = open(rootcanal_logpath, 'w')
             rootcanal_config = self.controller_configs['rootcanal']
-            rootcanal_hci_port = str(rootcanal_config.get("hci_port", "6402"))
+            rootcanal_hci_port = offset_port(
+                rootcanal_config.get("hci_port", "6402"))
             android_host_out = os.environ.get('ANDROID_HOST_OUT')
             rootcanal = android_host_out + "/nativetest64/root-canal/root-canal"
             self.rootcanal_process = subprocess.Popen(
                 [
                     rootcanal,
-                    str(rootcanal_config.get("test_port", "6401")),
+                    offset_port(rootcanal_config.get("test_port", "6401")),
                     rootcanal_hci_port,
-                    str(rootcanal_config.get("link_layer_port", "6403"))
+                    offset_port(
+                        rootcanal_config.get("link_layer_port", "6403"))
                 ],
                 cwd=ANDROID_BUILD_TOP,
                 env=os.environ.copy(),
@@ -0,0 +1,49 @@
+#! /bin/bash
+
+# Runs the facade only cert tests across several concurrent act.py invocations.
+# Test classes are distributed round robin over NUM_SHARDS shards and every
+# shard gets its own rootcanal and stack processes by shifting all configured
+# ports with GD_CERT_PORT_OFFSET. Each shard also logs to its own directory
+# under LOG_PATH_BASE so concurrent runs do not share rootcanal, backing process
+# and btsnoop logs.
+#
+# Sharding is per test class, so the slowest class bounds the total wall time
+# however many shards are used. L2capTest is that class: its max transmit test
+# alone waits out a 362 second timer.
+
+if [[ -z "${ANDROID_BUILD_TOP}" ]]; then
+  echo "ANDROID_BUILD_TOP is not set"
+  exit 1
+fi
+
+if [[ -z "${ANDROID_HOST_OUT}" ]]; then
+  echo "ANDROID_HOST_OUT is not set for host run"
+  exit 1
+fi
+
+NUM_SHARDS=${NUM_SHARDS:-4}
+# Must be larger than the span of ports used by a single testbed
+PORT_OFFSET_STEP=10
+LOG_PATH_BASE=${LOG_PATH_BASE:-/tmp/logs}
+
+unzip -o -q $ANDROID_BUILD_TOP/out/dist/bluetooth_cert_generated_py.zip -d $ANDROID_BUILD_TOP/out/dist/bluetooth_cert_generated_py
+
+SHARD_DIR=$(mktemp -d)
+split -d -n r/$NUM_SHARDS $ANDROID_BUILD_TOP/system/bt/gd/cert/cert_testcases_facade_only $SHARD_DIR/shard_
+
+PIDS=()
+SHARD_INDEX=0
+for SHARD in $SHARD_DIR/shard_*; do
+  # split leaves empty shards when NUM_SHARDS exceeds the number of test classes
+  [[ -s $SHARD ]] || continue
+  GD_CERT_PORT_OFFSET=$((SHARD_INDEX * PORT_OFFSET_STEP)) PYTHONPATH=$PYTHONPATH:$ANDROID_BUILD_TOP/out/host/linux-x86/lib64:$ANDROID_BUILD_TOP/system/bt/gd:$ANDROID_BUILD_TOP/out/dist/bluetooth_cert_generated_py python3.8 `which act.py` -c $ANDROID_BUILD_TOP/system/bt/gd/cert/host_only_config_facade_only.json -lp $LOG_PATH_BASE/shard_$SHARD_INDEX -tf $SHARD -tp $ANDROID_BUILD_TOP/system/bt/gd &
+  PIDS+=($!)
+  SHARD_INDEX=$((SHARD_INDEX + 1))
+done
+
+RESULT=0
+for PID in ${PIDS[@]}; do
+  wait $PID || RESULT=1
+done
+rm -rf $SHARD_DIR
+exit $RESULT
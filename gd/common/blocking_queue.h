@@ -20,6 +20,7 @@
 #include <condition_variable>
 #include <mutex>
 #include <queue>
+#include <vector>
 
 namespace bluetooth {
 namespace common {
@@ -40,11 +41,25 @@ class BlockingQueue {
     while (queue_.empty()) {
       not_empty_.wait(lock);
     }
-    T data = queue_.front();
+    T data = std::move(queue_.front());
     queue_.pop();
     return data;
   };
 
+  // Blocks until the queue is non-empty, then takes at most max_count elements that are already queued
+  std::vector<T> take_up_to(size_t max_count) {
+    std::unique_lock<std::mutex> lock(mutex_);
+    while (queue_.empty()) {
+      not_empty_.wait(lock);
+    }
+    std::vector<T> batch;
+    while (!queue_.empty() && batch.size() < max_count) {
+      batch.push_back(std::move(queue_.front()));
+      queue_.pop();
+    }
+    return batch;
+  };
+
   // Returns true if take() will not block within a time period
   bool wait_to_take(std::chrono::milliseconds time) {
     std::unique_lock<std::mutex> lock(mutex_);
@@ -16,7 +16,9 @@
 
 #include "common/blocking_queue.h"
 
+#include <memory>
 #include <thread>
+#include <vector>
 
 #include <gtest/gtest.h>
 
@@ -118,6 +120,22 @@ TEST_F(BlockingQueueTest, wait_for_non_empty_batch) {
   EXPECT_TRUE(queue_.empty());
 }
 
+TEST_F(BlockingQueueTest, take_up_to_stops_at_max_count) {
+  for (int data = 0; data < 5; data++) {
+    queue_.push(data);
+  }
+  EXPECT_EQ(queue_.take_up_to(3), std::vector<int>({0, 1, 2}));
+  EXPECT_EQ(queue_.take_up_to(3), std::vector<int>({3, 4}));
+  EXPECT_TRUE(queue_.empty());
+}
+
+TEST_F(BlockingQueueTest, take_up_to_waits_for_non_empty) {
+  std::thread waiter_thread([this] { EXPECT_EQ(queue_.take_up_to(3), std::vector<int>({1})); });
+  queue_.push(1);
+  waiter_thread.join();
+  EXPECT_TRUE(queue_.empty());
+}
+
 class VectorBlockingQueueTest : public ::testing::Test {
  protected:
   void SetUp() override {
@@ -140,6 +158,15 @@ TEST_F(VectorBlockingQueueTest, same_thread_push_and_pop) {
   EXPECT_TRUE(queue_.empty());
 }
 
+TEST(MoveOnlyBlockingQueueTest, take_moves_out_of_queue) {
+  BlockingQueue<std::unique_ptr<int>> queue;
+  queue.push(std::make_unique<int>(1));
+  queue.push(std::make_unique<int>(2));
+  EXPECT_EQ(*queue.take(), 1);
+  EXPECT_EQ(*queue.take(), 2);
+  EXPECT_TRUE(queue.empty());
+}
+
 }  // namespace
 }  // namespace common
 }  // namespace bluetooth
@@ -56,7 +56,15 @@ class GrpcEventQueue {
       // Wait for 500 ms so that cancellation can be caught in amortized 250 ms latency
       if (pending_events_.wait_to_take(500ms)) {
         LOG_DEBUG("%s: Got event after queue", log_name_.c_str());
-        writer->Write(pending_events_.take());
+        // Write a bounded batch of queued events, letting gRPC coalesce all but the last one into one flush
+        auto events = pending_events_.take_up_to(kMaxEventsPerFlush);
+        for (size_t i = 0; i < events.size() && !context->IsCancelled(); i++) {
+          if (i + 1 < events.size()) {
+            writer->Write(events[i], ::grpc::WriteOptions().set_buffer_hint());
+          } else {
+            writer->Write(events[i]);
+          }
+        }
       }
     }
     running_ = false;
@@ -78,6 +86,7 @@ class GrpcEventQueue {
   }
 
  private:
+  static constexpr size_t kMaxEventsPerFlush = 16;
   std::string log_name_;
   std::atomic<bool> running_ = false;
   common::BlockingQueue<T> pending_events_;
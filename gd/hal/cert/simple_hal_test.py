@@ -188,7 +188,7 @@ class SimpleHalTest(GdFacadeOnlyBaseTestClass):
 
             gap_name = hci_packets.GapData()
             gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
-            gap_name.data = list(bytes(b'Im_A_Cert!'))  # TODO: Fix and remove !
+            gap_name.data = list(b'Im_A_Cert!')  # TODO: Fix and remove !
 
             self.send_cert_hci_command(
                 hci_packets.LeSetExtendedAdvertisingDataBuilder(
@@ -285,7 +285,7 @@ class SimpleHalTest(GdFacadeOnlyBaseTestClass):
 
             gap_short_name = hci_packets.GapData()
             gap_short_name.data_type = hci_packets.GapDataType.SHORTENED_LOCAL_NAME
-            gap_short_name.data = list(bytes(b'Im_The_D'))
+            gap_short_name.data = list(b'Im_The_D')
 
             self.send_dut_hci_command(
                 hci_packets.LeSetExtendedAdvertisingScanResponseBuilder(
@@ -394,7 +394,7 @@ class SimpleHalTest(GdFacadeOnlyBaseTestClass):
 
             gap_name = hci_packets.GapData()
             gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
-            gap_name.data = list(bytes(b'Im_A_Cert!'))  # TODO: Fix and remove !
+            gap_name.data = list(b'Im_A_Cert!')  # TODO: Fix and remove !
 
             self.send_cert_hci_command(
                 hci_packets.LeSetExtendedAdvertisingDataBuilder(
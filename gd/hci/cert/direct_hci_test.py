@@ -190,7 +190,7 @@ class DirectHciTest(GdFacadeOnlyBaseTestClass):
                     advertising_handle, '0C:05:04:03:02:01'))
             gap_name = hci_packets.GapData()
             gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
-            gap_name.data = list(bytes(b'Im_A_Cert!'))  # TODO: Fix and remove !
+            gap_name.data = list(b'Im_A_Cert!')  # TODO: Fix and remove !
 
             self.send_hal_hci_command(
                 hci_packets.LeSetExtendedAdvertisingDataBuilder(
@@ -201,7 +201,7 @@ class DirectHciTest(GdFacadeOnlyBaseTestClass):
 
             gap_short_name = hci_packets.GapData()
             gap_short_name.data_type = hci_packets.GapDataType.SHORTENED_LOCAL_NAME
-            gap_short_name.data = list(bytes(b'Im_A_C'))
+            gap_short_name.data = list(b'Im_A_C')
 
             self.send_hal_hci_command(
                 hci_packets.LeSetExtendedAdvertisingScanResponseBuilder(
@@ -300,7 +300,7 @@ class DirectHciTest(GdFacadeOnlyBaseTestClass):
 
             gap_short_name = hci_packets.GapData()
             gap_short_name.data_type = hci_packets.GapDataType.SHORTENED_LOCAL_NAME
-            gap_short_name.data = list(bytes(b'Im_The_D'))
+            gap_short_name.data = list(b'Im_The_D')
 
             self.enqueue_hci_command(
                 hci_packets.LeSetExtendedAdvertisingScanResponseBuilder(
@@ -436,7 +436,7 @@ class DirectHciTest(GdFacadeOnlyBaseTestClass):
 
             gap_name = hci_packets.GapData()
             gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
-            gap_name.data = list(bytes(b'Im_A_Cert!'))  # TODO: Fix and remove !
+            gap_name.data = list(b'Im_A_Cert!')  # TODO: Fix and remove !
 
             self.send_hal_hci_command(
                 hci_packets.LeSetExtendedAdvertisingDataBuilder(
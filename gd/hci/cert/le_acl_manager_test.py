@@ -17,6 +17,7 @@
 from cert.gd_base_test_facade_only import GdFacadeOnlyBaseTestClass
 from cert.event_callback_stream import EventCallbackStream
 from cert.event_asserts import EventAsserts
+from cert import gap_data
 from google.protobuf import empty_pb2 as empty_proto
 from facade import rootservice_pb2 as facade_rootservice
 from facade import common_pb2 as common
@@ -27,6 +28,29 @@ import bluetooth_packets_python3 as bt_packets
 from bluetooth_packets_python3 import hci_packets
 
 
+CERT_RANDOM_ADDRESS = '0C:05:04:03:02:01'
+DUT_RANDOM_ADDRESS = '0D:05:04:03:02:01'
+CERT_CONNECTION_MSG = le_acl_manager_facade.LeConnectionMsg(
+    address_type=int(hci_packets.AddressType.RANDOM_DEVICE_ADDRESS),
+    address=bytes(CERT_RANDOM_ADDRESS, 'utf8'))
+
+DUT_ADVERTISING_CONFIG = le_advertising_facade.AdvertisingConfig(
+    advertisement=[
+        le_advertising_facade.GapDataMsg(
+            data=gap_data.complete_local_name(b'Im_The_DUT'))
+    ],
+    random_address=common.BluetoothAddress(
+        address=bytes(DUT_RANDOM_ADDRESS, 'utf8')),
+    interval_min=512,
+    interval_max=768,
+    event_type=le_advertising_facade.AdvertisingEventType.ADV_IND,
+    address_type=common.RANDOM_DEVICE_ADDRESS,
+    peer_address_type=common.PUBLIC_DEVICE_OR_IDENTITY_ADDRESS,
+    peer_address=common.BluetoothAddress(address=bytes(b'A6:A5:A4:A3:A2:A1')),
+    channel_map=7,
+    filter_policy=le_advertising_facade.AdvertisingFilterPolicy.ALL_DEVICES)
+
+
 class LeAclManagerTest(GdFacadeOnlyBaseTestClass):
 
     def setup_test(self):
@@ -104,11 +128,11 @@ class LeAclManagerTest(GdFacadeOnlyBaseTestClass):
 
             self.enqueue_hci_command(
                 hci_packets.LeSetExtendedAdvertisingRandomAddressBuilder(
-                    advertising_handle, '0C:05:04:03:02:01'), True)
+                    advertising_handle, CERT_RANDOM_ADDRESS), True)
 
             gap_name = hci_packets.GapData()
             gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
-            gap_name.data = list(bytes(b'Im_A_Cert'))
+            gap_name.data = list(b'Im_A_Cert')
 
             self.enqueue_hci_command(
                 hci_packets.LeSetExtendedAdvertisingDataBuilder(
@@ -119,7 +143,7 @@ class LeAclManagerTest(GdFacadeOnlyBaseTestClass):
 
             gap_short_name = hci_packets.GapData()
             gap_short_name.data_type = hci_packets.GapDataType.SHORTENED_LOCAL_NAME
-            gap_short_name.data = list(bytes(b'Im_A_C'))
+            gap_short_name.data = list(b'Im_A_C')
 
             self.enqueue_hci_command(
                 hci_packets.LeSetExtendedAdvertisingScanResponseBuilder(
@@ -138,11 +162,7 @@ class LeAclManagerTest(GdFacadeOnlyBaseTestClass):
 
             with EventCallbackStream(
                     self.device_under_test.hci_le_acl_manager.CreateConnection(
-                        le_acl_manager_facade.LeConnectionMsg(
-                            address_type=int(
-                                hci_packets.AddressType.RANDOM_DEVICE_ADDRESS),
-                            address=bytes('0C:05:04:03:02:01',
-                                          'utf8')))) as connection_event_stream:
+                        CERT_CONNECTION_MSG)) as connection_event_stream:
 
                 connection_event_asserts = EventAsserts(connection_event_stream)
 
@@ -208,34 +228,15 @@ class LeAclManagerTest(GdFacadeOnlyBaseTestClass):
             cert_acl_data_asserts = EventAsserts(cert_acl_data_stream)
 
             # DUT Advertises
-            gap_name = hci_packets.GapData()
-            gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
-            gap_name.data = list(bytes(b'Im_The_DUT'))
-            gap_data = le_advertising_facade.GapDataMsg(
-                data=bytes(gap_name.Serialize()))
-            config = le_advertising_facade.AdvertisingConfig(
-                advertisement=[gap_data],
-                random_address=common.BluetoothAddress(
-                    address=bytes(b'0D:05:04:03:02:01')),
-                interval_min=512,
-                interval_max=768,
-                event_type=le_advertising_facade.AdvertisingEventType.ADV_IND,
-                address_type=common.RANDOM_DEVICE_ADDRESS,
-                peer_address_type=common.PUBLIC_DEVICE_OR_IDENTITY_ADDRESS,
-                peer_address=common.BluetoothAddress(
-                    address=bytes(b'A6:A5:A4:A3:A2:A1')),
-                channel_map=7,
-                filter_policy=le_advertising_facade.AdvertisingFilterPolicy.
-                ALL_DEVICES)
             request = le_advertising_facade.CreateAdvertiserRequest(
-                config=config)
+                config=DUT_ADVERTISING_CONFIG)
 
             create_response = self.device_under_test.hci_le_advertising_manager.CreateAdvertiser(
                 request)
 
             # Cert Connects
             self.enqueue_hci_command(
-                hci_packets.LeSetRandomAddressBuilder('0C:05:04:03:02:01'),
+                hci_packets.LeSetRandomAddressBuilder(CERT_RANDOM_ADDRESS),
                 True)
             phy_scan_params = hci_packets.LeCreateConnPhyScanParameters()
             phy_scan_params.scan_interval = 0x60
@@ -251,7 +252,7 @@ class LeAclManagerTest(GdFacadeOnlyBaseTestClass):
                     hci_packets.InitiatorFilterPolicy.USE_PEER_ADDRESS,
                     hci_packets.OwnAddressType.RANDOM_DEVICE_ADDRESS,
                     hci_packets.AddressType.RANDOM_DEVICE_ADDRESS,
-                    '0D:05:04:03:02:01', 1, [phy_scan_params]), False)
+                    DUT_RANDOM_ADDRESS, 1, [phy_scan_params]), False)
 
             # Cert gets ConnectionComplete with a handle and sends ACL data
             handle = 0xfff
@@ -333,11 +334,11 @@ class LeAclManagerTest(GdFacadeOnlyBaseTestClass):
 
             self.enqueue_hci_command(
                 hci_packets.LeSetExtendedAdvertisingRandomAddressBuilder(
-                    advertising_handle, '0C:05:04:03:02:01'), True)
+                    advertising_handle, CERT_RANDOM_ADDRESS), True)
 
             gap_name = hci_packets.GapData()
             gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
-            gap_name.data = list(bytes(b'Im_A_Cert'))
+            gap_name.data = list(b'Im_A_Cert')
 
             self.enqueue_hci_command(
                 hci_packets.LeSetExtendedAdvertisingDataBuilder(
@@ -348,7 +349,7 @@ class LeAclManagerTest(GdFacadeOnlyBaseTestClass):
 
             gap_short_name = hci_packets.GapData()
             gap_short_name.data_type = hci_packets.GapDataType.SHORTENED_LOCAL_NAME
-            gap_short_name.data = list(bytes(b'Im_A_C'))
+            gap_short_name.data = list(b'Im_A_C')
 
             self.enqueue_hci_command(
                 hci_packets.LeSetExtendedAdvertisingScanResponseBuilder(
@@ -367,11 +368,7 @@ class LeAclManagerTest(GdFacadeOnlyBaseTestClass):
 
             with EventCallbackStream(
                     self.device_under_test.hci_le_acl_manager.CreateConnection(
-                        le_acl_manager_facade.LeConnectionMsg(
-                            address_type=int(
-                                hci_packets.AddressType.RANDOM_DEVICE_ADDRESS),
-                            address=bytes('0C:05:04:03:02:01',
-                                          'utf8')))) as connection_event_stream:
+                        CERT_CONNECTION_MSG)) as connection_event_stream:
 
                 connection_event_asserts = EventAsserts(connection_event_stream)
 
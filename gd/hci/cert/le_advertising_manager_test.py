@@ -21,6 +21,7 @@ import logging
 from cert.gd_base_test_facade_only import GdFacadeOnlyBaseTestClass
 from cert.event_callback_stream import EventCallbackStream
 from cert.event_asserts import EventAsserts
+from cert import gap_data
 from google.protobuf import empty_pb2 as empty_proto
 from facade import rootservice_pb2 as facade_rootservice
 from hci.facade import facade_pb2 as hci_facade
@@ -30,6 +31,22 @@ from bluetooth_packets_python3 import hci_packets
 from facade import common_pb2 as common
 
 
+DUT_ADVERTISING_CONFIG = le_advertising_facade.AdvertisingConfig(
+    advertisement=[
+        le_advertising_facade.GapDataMsg(
+            data=gap_data.complete_local_name(b'Im_The_DUT!'))
+    ],
+    random_address=common.BluetoothAddress(address=bytes(b'0D:05:04:03:02:01')),
+    interval_min=512,
+    interval_max=768,
+    event_type=le_advertising_facade.AdvertisingEventType.ADV_IND,
+    address_type=common.RANDOM_DEVICE_ADDRESS,
+    peer_address_type=common.PUBLIC_DEVICE_OR_IDENTITY_ADDRESS,
+    peer_address=common.BluetoothAddress(address=bytes(b'A6:A5:A4:A3:A2:A1')),
+    channel_map=7,
+    filter_policy=le_advertising_facade.AdvertisingFilterPolicy.ALL_DEVICES)
+
+
 class LeAdvertisingManagerTest(GdFacadeOnlyBaseTestClass):
 
     def setup_test(self):
@@ -96,27 +113,8 @@ class LeAdvertisingManagerTest(GdFacadeOnlyBaseTestClass):
                     hci_packets.FilterDuplicates.DISABLED, 0, 0), True)
 
             # DUT Advertises
-            gap_name = hci_packets.GapData()
-            gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
-            gap_name.data = list(bytes(b'Im_The_DUT!'))
-            gap_data = le_advertising_facade.GapDataMsg(
-                data=bytes(gap_name.Serialize()))
-            config = le_advertising_facade.AdvertisingConfig(
-                advertisement=[gap_data],
-                random_address=common.BluetoothAddress(
-                    address=bytes(b'0D:05:04:03:02:01')),
-                interval_min=512,
-                interval_max=768,
-                event_type=le_advertising_facade.AdvertisingEventType.ADV_IND,
-                address_type=common.RANDOM_DEVICE_ADDRESS,
-                peer_address_type=common.PUBLIC_DEVICE_OR_IDENTITY_ADDRESS,
-                peer_address=common.BluetoothAddress(
-                    address=bytes(b'A6:A5:A4:A3:A2:A1')),
-                channel_map=7,
-                filter_policy=le_advertising_facade.AdvertisingFilterPolicy.
-                ALL_DEVICES)
             request = le_advertising_facade.CreateAdvertiserRequest(
-                config=config)
+                config=DUT_ADVERTISING_CONFIG)
 
             create_response = self.device_under_test.hci_le_advertising_manager.CreateAdvertiser(
                 request)
@@ -21,15 +21,31 @@ import logging
 from cert.gd_base_test_facade_only import GdFacadeOnlyBaseTestClass
 from cert.event_callback_stream import EventCallbackStream
 from cert.event_asserts import EventAsserts
+from cert import gap_data
 from google.protobuf import empty_pb2 as empty_proto
 from facade import rootservice_pb2 as facade_rootservice
 from hci.facade import facade_pb2 as hci_facade
 from hci.facade import le_scanning_manager_facade_pb2 as le_scanning_facade
 from hci.facade import le_advertising_manager_facade_pb2 as le_advertising_facade
-from bluetooth_packets_python3 import hci_packets
 from facade import common_pb2 as common
 
 
+CERT_ADVERTISING_CONFIG = le_advertising_facade.AdvertisingConfig(
+    advertisement=[
+        le_advertising_facade.GapDataMsg(
+            data=gap_data.complete_local_name(b'Im_The_CERT!'))
+    ],
+    random_address=common.BluetoothAddress(address=bytes(b'A6:A5:A4:A3:A2:A1')),
+    interval_min=512,
+    interval_max=768,
+    event_type=le_advertising_facade.AdvertisingEventType.ADV_IND,
+    address_type=common.RANDOM_DEVICE_ADDRESS,
+    peer_address_type=common.PUBLIC_DEVICE_OR_IDENTITY_ADDRESS,
+    peer_address=common.BluetoothAddress(address=bytes(b'0C:05:04:03:02:01')),
+    channel_map=7,
+    filter_policy=le_advertising_facade.AdvertisingFilterPolicy.ALL_DEVICES)
+
+
 class LeScanningManagerTest(GdFacadeOnlyBaseTestClass):
 
     def setup_test(self):
@@ -76,27 +92,8 @@ class LeScanningManagerTest(GdFacadeOnlyBaseTestClass):
             hci_event_asserts = EventAsserts(advertising_event_stream)
 
             # CERT Advertises
-            gap_name = hci_packets.GapData()
-            gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
-            gap_name.data = list(bytes(b'Im_The_CERT!'))
-            gap_data = le_advertising_facade.GapDataMsg(
-                data=bytes(gap_name.Serialize()))
-            config = le_advertising_facade.AdvertisingConfig(
-                advertisement=[gap_data],
-                random_address=common.BluetoothAddress(
-                    address=bytes(b'A6:A5:A4:A3:A2:A1')),
-                interval_min=512,
-                interval_max=768,
-                event_type=le_advertising_facade.AdvertisingEventType.ADV_IND,
-                address_type=common.RANDOM_DEVICE_ADDRESS,
-                peer_address_type=common.PUBLIC_DEVICE_OR_IDENTITY_ADDRESS,
-                peer_address=common.BluetoothAddress(
-                    address=bytes(b'0C:05:04:03:02:01')),
-                channel_map=7,
-                filter_policy=le_advertising_facade.AdvertisingFilterPolicy.
-                ALL_DEVICES)
             request = le_advertising_facade.CreateAdvertiserRequest(
-                config=config)
+                config=CERT_ADVERTISING_CONFIG)
 
             create_response = self.cert_device.hci_le_advertising_manager.CreateAdvertiser(
                 request)
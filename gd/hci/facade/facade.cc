@@ -89,9 +89,15 @@ class HciLayerFacadeService : public HciLayerFacade::Service {
 
   ::grpc::Status RegisterEventHandler(::grpc::ServerContext* context, const ::bluetooth::hci::EventCodeMsg* event,
                                       ::google::protobuf::Empty* response) override {
-    hci_layer_->RegisterEventHandler(static_cast<EventCode>(event->code()),
-                                     common::Bind(&HciLayerFacadeService::on_event, common::Unretained(this)),
-                                     facade_handler_);
+    register_event_handler(static_cast<EventCode>(event->code()));
+    return ::grpc::Status::OK;
+  }
+
+  ::grpc::Status RegisterEventHandlers(::grpc::ServerContext* context, const ::bluetooth::hci::EventCodesMsg* events,
+                                       ::google::protobuf::Empty* response) override {
+    for (auto code : events->codes()) {
+      register_event_handler(static_cast<EventCode>(code));
+    }
     return ::grpc::Status::OK;
   }
 
@@ -189,6 +195,12 @@ class HciLayerFacadeService : public HciLayerFacade::Service {
     pending_acl_events_.OnIncomingEvent(std::move(incoming));
   }
 
+  void register_event_handler(EventCode event_code) {
+    hci_layer_->RegisterEventHandler(event_code,
+                                     common::Bind(&HciLayerFacadeService::on_event, common::Unretained(this)),
+                                     facade_handler_);
+  }
+
   void on_event(hci::EventPacketView view) {
     ASSERT(view.IsValid());
     LOG_INFO("Got an Event %s", EventCodeText(view.GetEventCode()).c_str());
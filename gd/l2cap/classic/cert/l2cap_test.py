@@ -13,7 +13,6 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-import time
 from datetime import timedelta
 from mobly import asserts
 
@@ -32,6 +31,14 @@ from bluetooth_packets_python3 import hci_packets, l2cap_packets
 # Assemble a sample packet. TODO: Use RawBuilder
 SAMPLE_PACKET = l2cap_packets.CommandRejectNotUnderstoodBuilder(1)
 
+# Instead of sleeping through a DUT timer before looking for its effect, wait
+# for the effect with a deadline of the timer plus some slack so that the test
+# moves on as soon as the expected packet shows up
+RETRANSMISSION_TIMEOUT = timedelta(seconds=2)
+# Retransmission timer = 2, 20 * monitor timer = 360, so total timeout is 362
+MAX_TRANSMIT_TIMEOUT = timedelta(seconds=362)
+EVENT_TIMEOUT_SLACK = timedelta(seconds=EventAsserts.DEFAULT_TIMEOUT_SECONDS)
+
 
 class L2capTest(GdFacadeOnlyBaseTestClass):
 
@@ -1380,10 +1387,9 @@ class L2capTest(GdFacadeOnlyBaseTestClass):
             self.device_under_test.l2cap.SendDynamicChannelPacket(
                 l2cap_facade_pb2.DynamicChannelPacket(psm=psm, payload=b'abc'))
             # TODO: Always use their retransmission timeout value
-            time.sleep(2)
             cert_acl_data_asserts.assert_event_occurs(
-                lambda packet: self.get_p_from_ertm_s_frame(scid, packet) == l2cap_packets.Poll.POLL
-            )
+                lambda packet: self.get_p_from_ertm_s_frame(scid, packet) == l2cap_packets.Poll.POLL,
+                timeout=RETRANSMISSION_TIMEOUT + EVENT_TIMEOUT_SLACK)
 
     def test_transmit_s_frame_rr_with_final_bit_set(self):
         """
@@ -1461,10 +1467,9 @@ class L2capTest(GdFacadeOnlyBaseTestClass):
             self.device_under_test.l2cap.SendDynamicChannelPacket(
                 l2cap_facade_pb2.DynamicChannelPacket(psm=psm, payload=b'abc'))
 
-            # Retransmission timer = 2, 20 * monitor timer = 360, so total timeout is 362
-            time.sleep(362)
             cert_acl_data_asserts.assert_event_occurs(
-                self.is_correct_disconnection_request)
+                self.is_correct_disconnection_request,
+                timeout=MAX_TRANSMIT_TIMEOUT + EVENT_TIMEOUT_SLACK)
 
     def test_i_frame_transmissions_exceed_max_transmit(self):
         """
@@ -1602,10 +1607,9 @@ class L2capTest(GdFacadeOnlyBaseTestClass):
                 l2cap_facade_pb2.DynamicChannelPacket(psm=psm, payload=b'abc'))
 
             # TODO: Always use their retransmission timeout value
-            time.sleep(2)
             cert_acl_data_asserts.assert_event_occurs(
-                lambda packet: self.get_p_from_ertm_s_frame(scid, packet) == l2cap_packets.Poll.POLL
-            )
+                lambda packet: self.get_p_from_ertm_s_frame(scid, packet) == l2cap_packets.Poll.POLL,
+                timeout=RETRANSMISSION_TIMEOUT + EVENT_TIMEOUT_SLACK)
 
             s_frame = l2cap_packets.EnhancedSupervisoryFrameBuilder(
                 dcid, l2cap_packets.SupervisoryFunction.RECEIVER_READY,
@@ -1653,10 +1657,9 @@ class L2capTest(GdFacadeOnlyBaseTestClass):
                 l2cap_facade_pb2.DynamicChannelPacket(psm=psm, payload=b'abc'))
 
             # TODO: Always use their retransmission timeout value
-            time.sleep(2)
             cert_acl_data_asserts.assert_event_occurs(
-                lambda packet: self.get_p_from_ertm_s_frame(scid, packet) == l2cap_packets.Poll.POLL
-            )
+                lambda packet: self.get_p_from_ertm_s_frame(scid, packet) == l2cap_packets.Poll.POLL,
+                timeout=RETRANSMISSION_TIMEOUT + EVENT_TIMEOUT_SLACK)
 
             i_frame = l2cap_packets.EnhancedInformationFrameBuilder(
                 dcid, 0, l2cap_packets.Final.POLL_RESPONSE, 0,
@@ -1704,10 +1707,9 @@ class L2capTest(GdFacadeOnlyBaseTestClass):
                 l2cap_facade_pb2.DynamicChannelPacket(psm=0x33, payload=b'abc'))
 
             # TODO: Always use their retransmission timeout value
-            time.sleep(2)
             cert_acl_data_asserts.assert_event_occurs(
-                lambda packet: self.get_p_from_ertm_s_frame(scid, packet) == l2cap_packets.Poll.POLL
-            )
+                lambda packet: self.get_p_from_ertm_s_frame(scid, packet) == l2cap_packets.Poll.POLL,
+                timeout=RETRANSMISSION_TIMEOUT + EVENT_TIMEOUT_SLACK)
 
             s_frame = l2cap_packets.EnhancedSupervisoryFrameBuilder(
                 dcid, l2cap_packets.SupervisoryFunction.RECEIVER_NOT_READY,
@@ -111,7 +111,7 @@ class NeighborTest(GdFacadeOnlyBaseTestClass):
         name_string = b'Im_A_Cert'
         gap_name = hci_packets.GapData()
         gap_name.data_type = hci_packets.GapDataType.COMPLETE_LOCAL_NAME
-        gap_name.data = list(bytes(name_string))
+        gap_name.data = list(name_string)
         gap_data = list([gap_name])
 
         self.enqueue_hci_command(
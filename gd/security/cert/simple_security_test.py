@@ -14,6 +14,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 import os
 import sys
@@ -34,28 +35,66 @@ from security import facade_pb2 as security_facade
 from bluetooth_packets_python3 import hci_packets
 import bluetooth_packets_python3 as bt_packets
 
+# Messages that never change between calls, built once instead of per call
+EMPTY = empty_proto.Empty()
+DUT_START_STACK_REQUEST = facade_rootservice_pb2.StartStackRequest(
+    module_under_test=facade_rootservice_pb2.BluetoothModule.Value('SECURITY'))
+CERT_START_STACK_REQUEST = facade_rootservice_pb2.StartStackRequest(
+    module_under_test=facade_rootservice_pb2.BluetoothModule.Value('L2CAP'))
+STOP_STACK_REQUEST = facade_rootservice_pb2.StopStackRequest()
+ENABLE_PAGE_SCAN = neighbor_facade.EnableMsg(enabled=True)
+DUT_NAME = b'ImTheDUT'
+CERT_NAME = b'ImTheCert'
+DUT_WRITE_LOCAL_NAME = controller_facade.NameMsg(name=DUT_NAME)
+CERT_WRITE_LOCAL_NAME = controller_facade.NameMsg(name=CERT_NAME)
+
+
+# Event matchers are created once here instead of a new lambda per assert,
+# expected values are resolved up front rather than on every incoming event
+def is_write_simple_pairing_mode_complete(event):
+    return b'\x0e\x04\x01\x56\x0c' in event.event
+
+
+def hci_event_matcher(event_code):
+
+    def matcher(event):
+        logging.debug(event.event)
+        return event_code in event.event
+
+    return matcher
+
+
+is_io_capability_request = hci_event_matcher(
+    hci_packets.EventCode.IO_CAPABILITY_REQUEST)
+is_user_confirmation_request = hci_event_matcher(
+    hci_packets.EventCode.USER_CONFIRMATION_REQUEST)
+
+
+def bond_event_matcher(message_type):
+
+    def matcher(bond_event):
+        return bond_event.message_type == message_type
+
+    return matcher
+
+
+is_device_bonded = bond_event_matcher(security_facade.BondMsgType.DEVICE_BONDED)
+
 
 class SimpleSecurityTest(GdFacadeOnlyBaseTestClass):
 
     def setup_test(self):
-        self.device_under_test.rootservice.StartStack(
-            facade_rootservice_pb2.StartStackRequest(
-                module_under_test=facade_rootservice_pb2.BluetoothModule.Value(
-                    'SECURITY'),))
-        self.cert_device.rootservice.StartStack(
-            facade_rootservice_pb2.StartStackRequest(
-                module_under_test=facade_rootservice_pb2.BluetoothModule.Value(
-                    'L2CAP'),))
-
-        self.device_under_test.address = self.device_under_test.controller_read_only_property.ReadLocalAddress(
-            empty_proto.Empty()).address
-        self.cert_device.address = self.cert_device.controller_read_only_property.ReadLocalAddress(
-            empty_proto.Empty()).address
-
-        self.device_under_test.neighbor.EnablePageScan(
-            neighbor_facade.EnableMsg(enabled=True))
-        self.cert_device.neighbor.EnablePageScan(
-            neighbor_facade.EnableMsg(enabled=True))
+        # Both stacks are independent, bring them up concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dut_setup = executor.submit(self._setup_device,
+                                        self.device_under_test,
+                                        DUT_START_STACK_REQUEST,
+                                        DUT_WRITE_LOCAL_NAME)
+            cert_setup = executor.submit(self._setup_device, self.cert_device,
+                                         CERT_START_STACK_REQUEST,
+                                         CERT_WRITE_LOCAL_NAME)
+            dut_setup.result()
+            cert_setup.result()
 
         self.dut_address = common.BluetoothAddress(
             address=self.device_under_test.address)
@@ -64,27 +103,35 @@ class SimpleSecurityTest(GdFacadeOnlyBaseTestClass):
 
         self.dut_address_with_type = common.BluetoothAddressWithType()
         self.dut_address_with_type.address.CopyFrom(self.dut_address)
-        self.dut_address_with_type.type = common.BluetoothPeerAddressTypeEnum.PUBLIC_DEVICE_OR_IDENTITY_ADDRESS
+        self.dut_address_with_type.type = common.BluetoothAddressTypeEnum.PUBLIC_DEVICE_ADDRESS
 
         self.cert_address_with_type = common.BluetoothAddressWithType()
         self.cert_address_with_type.address.CopyFrom(self.cert_address)
-        self.cert_address_with_type.type = common.BluetoothPeerAddressTypeEnum.PUBLIC_DEVICE_OR_IDENTITY_ADDRESS
+        self.cert_address_with_type.type = common.BluetoothAddressTypeEnum.PUBLIC_DEVICE_ADDRESS
 
-        self.device_under_test.wait_channel_ready()
-        self.cert_device.wait_channel_ready()
+    def teardown_test(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dut_teardown = executor.submit(
+                self.device_under_test.rootservice.StopStack,
+                STOP_STACK_REQUEST)
+            cert_teardown = executor.submit(
+                self.cert_device.rootservice.StopStack, STOP_STACK_REQUEST)
+            dut_teardown.result()
+            cert_teardown.result()
 
-        self.cert_name = b'ImTheCert'
-        self.cert_device.hci_controller.WriteLocalName(
-            controller_facade.NameMsg(name=self.cert_name))
-        self.dut_name = b'ImTheDUT'
-        self.device_under_test.hci_controller.WriteLocalName(
-            controller_facade.NameMsg(name=self.dut_name))
+    def _setup_device(self, device, start_stack_request,
+                      write_local_name_request):
+        device.rootservice.StartStack(start_stack_request)
 
-    def teardown_test(self):
-        self.device_under_test.rootservice.StopStack(
-            facade_rootservice_pb2.StopStackRequest())
-        self.cert_device.rootservice.StopStack(
-            facade_rootservice_pb2.StopStackRequest())
+        # The local address is read once per test and reused afterwards
+        device.address = device.controller_read_only_property.ReadLocalAddress(
+            EMPTY).address
+
+        device.neighbor.EnablePageScan(ENABLE_PAGE_SCAN)
+
+        device.wait_channel_ready()
+
+        device.hci_controller.WriteLocalName(write_local_name_request)
 
     def tmp_register_for_event(self, event_code):
         msg = hci_facade.EventCodeMsg(code=int(event_code))
@@ -98,9 +145,10 @@ class SimpleSecurityTest(GdFacadeOnlyBaseTestClass):
         else:
             self.device_under_test.hci.EnqueueCommandWithStatus(cmd)
 
-    def register_for_event(self, event_code):
-        msg = hci_facade.EventCodeMsg(code=int(event_code))
-        self.cert_device.hci.RegisterEventHandler(msg)
+    def register_for_events(self, *event_codes):
+        msg = hci_facade.EventCodesMsg(
+            codes=[int(event_code) for event_code in event_codes])
+        self.cert_device.hci.RegisterEventHandlers(msg)
 
     def enqueue_hci_command(self, command, expect_complete):
         cmd_bytes = bytes(command.Serialize())
@@ -118,31 +166,34 @@ class SimpleSecurityTest(GdFacadeOnlyBaseTestClass):
             data=acl)
         self.cert_device.hci.SendAclData(acl_msg)
 
-    def pair_justworks(self, cert_iocap_reply, expected_ui_event):
+    def pair_justworks(self, cert_io_capability, expected_ui_event):
+        """
+        Pair the DUT with the CERT using SSP, the CERT answers the IO
+        capability request with |cert_io_capability| and the DUT is expected
+        to show |expected_ui_event|
+        """
         # Cert event registration
-        self.register_for_event(hci_packets.EventCode.LINK_KEY_REQUEST)
-        self.register_for_event(hci_packets.EventCode.IO_CAPABILITY_REQUEST)
-        self.register_for_event(hci_packets.EventCode.IO_CAPABILITY_RESPONSE)
-        self.register_for_event(hci_packets.EventCode.USER_PASSKEY_NOTIFICATION)
-        self.register_for_event(hci_packets.EventCode.USER_CONFIRMATION_REQUEST)
-        self.register_for_event(
-            hci_packets.EventCode.REMOTE_HOST_SUPPORTED_FEATURES_NOTIFICATION)
-        self.register_for_event(hci_packets.EventCode.LINK_KEY_NOTIFICATION)
-        self.register_for_event(hci_packets.EventCode.SIMPLE_PAIRING_COMPLETE)
-        with EventCallbackStream(self.device_under_test.security.FetchUiEvents(empty_proto.Empty())) as dut_ui_stream, \
-            EventCallbackStream(self.device_under_test.security.FetchBondEvents(empty_proto.Empty())) as dut_bond_stream, \
-            EventCallbackStream(self.device_under_test.neighbor.GetRemoteNameEvents(empty_proto.Empty())) as name_event_stream, \
-            EventCallbackStream(self.cert_device.hci.FetchEvents(empty_proto.Empty())) as cert_hci_event_stream:
+        self.register_for_events(
+            hci_packets.EventCode.LINK_KEY_REQUEST,
+            hci_packets.EventCode.IO_CAPABILITY_REQUEST,
+            hci_packets.EventCode.IO_CAPABILITY_RESPONSE,
+            hci_packets.EventCode.USER_PASSKEY_NOTIFICATION,
+            hci_packets.EventCode.USER_CONFIRMATION_REQUEST,
+            hci_packets.EventCode.REMOTE_HOST_SUPPORTED_FEATURES_NOTIFICATION,
+            hci_packets.EventCode.LINK_KEY_NOTIFICATION,
+            hci_packets.EventCode.SIMPLE_PAIRING_COMPLETE)
+        with EventCallbackStream(self.device_under_test.security.FetchUiEvents(EMPTY)) as dut_ui_stream, \
+            EventCallbackStream(self.device_under_test.security.FetchBondEvents(EMPTY)) as dut_bond_stream, \
+            EventCallbackStream(self.device_under_test.neighbor.GetRemoteNameEvents(EMPTY)) as name_event_stream, \
+            EventCallbackStream(self.cert_device.hci.FetchEvents(EMPTY)) as cert_hci_event_stream:
 
             cert_hci_event_asserts = EventAsserts(cert_hci_event_stream)
             dut_ui_event_asserts = EventAsserts(dut_ui_stream)
             dut_bond_asserts = EventAsserts(dut_bond_stream)
             dut_name_asserts = EventAsserts(name_event_stream)
 
-            dut_address = self.device_under_test.hci_controller.GetMacAddress(
-                empty_proto.Empty()).address
-            cert_address = self.cert_device.hci_controller.GetMacAddress(
-                empty_proto.Empty()).address
+            dut_address = self.device_under_test.address
+            cert_address = self.cert_device.address
 
             # Enable Simple Secure Pairing
             self.enqueue_hci_command(
@@ -150,7 +201,7 @@ class SimpleSecurityTest(GdFacadeOnlyBaseTestClass):
                     hci_packets.Enable.ENABLED), True)
 
             cert_hci_event_asserts.assert_event_occurs(
-                lambda msg: b'\x0e\x04\x01\x56\x0c' in msg.event)
+                is_write_simple_pairing_mode_complete)
 
             # Get the name
             self.device_under_test.neighbor.ReadRemoteName(
@@ -160,22 +211,23 @@ class SimpleSecurityTest(GdFacadeOnlyBaseTestClass):
                     clock_offset=0x6855))
 
             dut_name_asserts.assert_event_occurs(
-                lambda msg: self.cert_name in msg.name)
+                lambda msg: CERT_NAME in msg.name)
 
             self.device_under_test.security.CreateBond(
-                common.BluetoothAddressWithType(
-                    address=common.BluetoothAddress(address=cert_address),
-                    type=common.BluetoothAddressTypeEnum.PUBLIC_DEVICE_ADDRESS))
+                self.cert_address_with_type)
 
             cert_hci_event_asserts.assert_event_occurs(
-                lambda event: logging.debug(event.event) or hci_packets.EventCode.IO_CAPABILITY_REQUEST in event.event
-            )
+                is_io_capability_request)
 
-            self.enqueue_hci_command(cert_iocap_reply, True)
+            self.enqueue_hci_command(
+                hci_packets.IoCapabilityRequestReplyBuilder(
+                    dut_address.decode('utf8'), cert_io_capability,
+                    hci_packets.OobDataPresent.NOT_PRESENT,
+                    hci_packets.AuthenticationRequirements.
+                    DEDICATED_BONDING_MITM_PROTECTION), True)
 
             cert_hci_event_asserts.assert_event_occurs(
-                lambda event: logging.debug(event.event) or hci_packets.EventCode.USER_CONFIRMATION_REQUEST in event.event
-            )
+                is_user_confirmation_request)
             self.enqueue_hci_command(
                 hci_packets.UserConfirmationRequestReplyBuilder(
                     dut_address.decode('utf8')), True)
@@ -199,39 +251,16 @@ class SimpleSecurityTest(GdFacadeOnlyBaseTestClass):
                     boolean=True,
                     unique_id=ui_id))
 
-            dut_bond_asserts.assert_event_occurs(
-                lambda bond_event: bond_event.message_type == security_facade.BondMsgType.DEVICE_BONDED
-            )
+            dut_bond_asserts.assert_event_occurs(is_device_bonded)
 
     def test_display_only(self):
-        dut_address = self.device_under_test.hci_controller.GetMacAddress(
-            empty_proto.Empty()).address
-        self.pair_justworks(
-            hci_packets.IoCapabilityRequestReplyBuilder(
-                dut_address.decode('utf8'),
-                hci_packets.IoCapability.DISPLAY_ONLY,
-                hci_packets.OobDataPresent.NOT_PRESENT, hci_packets.
-                AuthenticationRequirements.DEDICATED_BONDING_MITM_PROTECTION),
-            security_facade.UiMsgType.DISPLAY_YES_NO_WITH_VALUE)
+        self.pair_justworks(hci_packets.IoCapability.DISPLAY_ONLY,
+                            security_facade.UiMsgType.DISPLAY_YES_NO_WITH_VALUE)
 
     def test_no_input_no_output(self):
-        dut_address = self.device_under_test.hci_controller.GetMacAddress(
-            empty_proto.Empty()).address
-        self.pair_justworks(
-            hci_packets.IoCapabilityRequestReplyBuilder(
-                dut_address.decode('utf8'),
-                hci_packets.IoCapability.NO_INPUT_NO_OUTPUT,
-                hci_packets.OobDataPresent.NOT_PRESENT, hci_packets.
-                AuthenticationRequirements.DEDICATED_BONDING_MITM_PROTECTION),
-            security_facade.UiMsgType.DISPLAY_YES_NO)
+        self.pair_justworks(hci_packets.IoCapability.NO_INPUT_NO_OUTPUT,
+                            security_facade.UiMsgType.DISPLAY_YES_NO)
 
     def test_display_yes_no(self):
-        dut_address = self.device_under_test.hci_controller.GetMacAddress(
-            empty_proto.Empty()).address
-        self.pair_justworks(
-            hci_packets.IoCapabilityRequestReplyBuilder(
-                dut_address.decode('utf8'),
-                hci_packets.IoCapability.DISPLAY_YES_NO,
-                hci_packets.OobDataPresent.NOT_PRESENT, hci_packets.
-                AuthenticationRequirements.DEDICATED_BONDING_MITM_PROTECTION),
-            security_facade.UiMsgType.DISPLAY_YES_NO_WITH_VALUE)
+        self.pair_justworks(hci_packets.IoCapability.DISPLAY_YES_NO,
+                            security_facade.UiMsgType.DISPLAY_YES_NO_WITH_VALUE)